@@ -4,7 +4,7 @@ from scripts.lib.zulip_tools import os_families
 
 ZULIP_PATH = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-VENV_DEPENDENCIES = [
+VENV_DEPENDENCIES = (
     "build-essential",
     "libffi-dev",
     "libldap2-dev",
@@ -25,9 +25,9 @@ VENV_DEPENDENCIES = [
     "libvips",  # For thumbnailing
     "libvips-tools",
     "libicu-dev",  # For building pyicu
-]
+)
 
-COMMON_YUM_VENV_DEPENDENCIES = [
+COMMON_YUM_VENV_DEPENDENCIES = (
     "libffi-devel",
     "openldap-devel",
     "libyaml-devel",
@@ -44,22 +44,22 @@ COMMON_YUM_VENV_DEPENDENCIES = [
     "jq",
     "vips",  # For thumbnailing
     "vips-tools",
-]
+)
 
-REDHAT_VENV_DEPENDENCIES = [
+REDHAT_VENV_DEPENDENCIES = (
     *COMMON_YUM_VENV_DEPENDENCIES,
     "python36-devel",
     "python-virtualenv",
-]
+)
 
-FEDORA_VENV_DEPENDENCIES = [
+FEDORA_VENV_DEPENDENCIES = (
     *COMMON_YUM_VENV_DEPENDENCIES,
     "python3-pip",
     "virtualenv",  # see https://unix.stackexchange.com/questions/27877/install-virtualenv-on-fedora-16
-]
+)
 
 
-def get_venv_dependencies(vendor: str, os_version: str) -> list[str]:
+def get_venv_dependencies(vendor: str, os_version: str) -> tuple[str, ...]:
     if "debian" in os_families():
         return VENV_DEPENDENCIES
     elif "rhel" in os_families():